@@ -67,6 +67,7 @@ pub enum Commands {
     /// Initialize a new Galaxy in the current directory
     Init(InitArgs),
     /// List the celestial bodies in the Galaxy
+    #[command(visible_alias = "ls")]
     List(ListArgs),
     /// Create a new celestial body
     New(NewArgs),
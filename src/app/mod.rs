@@ -70,6 +70,8 @@ type Result<T> = std::result::Result<T, AppError>;
 pub enum AppError {
     IoError(io::Error),
     DatabaseError(DatabaseError),
+    /// The requested feature has not been implemented yet
+    NotImplemented(&'static str),
 }
 
 impl std::fmt::Display for AppError {
@@ -77,6 +79,7 @@ impl std::fmt::Display for AppError {
         match self {
             Self::IoError(e) => write!(f, "Error during IO operation: {e}"),
             Self::DatabaseError(e) => write!(f, "Error during database operation: {e}"),
+            Self::NotImplemented(feature) => write!(f, "Not yet implemented: {feature}"),
         }
     }
 }
@@ -115,13 +118,13 @@ pub fn run(args: Cli) -> Result<()> {
 
     match args.verbose {
         0 => {}
-        _ => todo!(),
+        _ => return Err(AppError::NotImplemented("verbose output")),
     }
 
     match args.command {
         Some(Commands::Init(args)) => cli::init(args),
         Some(Commands::List(args)) => cli::list(args),
         Some(Commands::New(args)) => cli::new(args),
-        None => todo!(),
+        None => Err(AppError::NotImplemented("TUI")),
     }
 }
@@ -271,6 +271,10 @@ pub struct Galaxy {
     /// A map from the celestial body's id to the index within the corresponding
     /// vector (`comets`, `planets`, or `stars`)
     id_to_index: HashMap<ID, CelestialBodyIndex>,
+
+    /// The location of the database the `Galaxy` was loaded from. This is
+    /// remembered so that saving does not need to search for it again.
+    path: Option<PathBuf>,
 }
 
 impl Galaxy {
@@ -288,9 +292,11 @@ impl Galaxy {
     /// - There is an error while parsing the database
     pub fn load() -> Result<Self> {
         let path = Database::location()?;
-        let file = fs::File::open(path)?;
+        let file = fs::File::open(&path)?;
         let reader = io::BufReader::new(file);
-        Self::load_from_reader(reader)
+        let mut galaxy = Self::load_from_reader(reader)?;
+        galaxy.path = Some(path);
+        Ok(galaxy)
     }
 
     /// A helper function that reads the `Database` and uses it to create a
@@ -299,7 +305,8 @@ impl Galaxy {
     fn load_from_reader<R: io::Read>(reader: R) -> Result<Self> {
         let value: Database = serde_json::from_reader(reader)?;
 
-        let mut id_to_index: HashMap<ID, CelestialBodyIndex> = HashMap::new();
+        let count = value.comets.len() + value.planets.len() + value.stars.len();
+        let mut id_to_index: HashMap<ID, CelestialBodyIndex> = HashMap::with_capacity(count);
         for (i, comet) in value.comets.iter().enumerate() {
             id_to_index.insert(
                 comet.id,
@@ -324,6 +331,7 @@ impl Galaxy {
             planets: value.planets,
             stars: value.stars,
             id_to_index,
+            path: None,
         })
     }
 
@@ -350,8 +358,9 @@ impl Galaxy {
         self.save_to_writer(writer)
     }
 
-    /// Saves `Galaxy` to a database. The database will be found by searching
-    /// parent directories for `Database::DEFAULT_FILENAME`.
+    /// Saves `Galaxy` to a database. If the `Galaxy` was loaded from a
+    /// database, that database is used. Otherwise, the database will be found
+    /// by searching parent directories for `Database::DEFAULT_FILENAME`.
     ///
     /// **WARNING**: This action is destructive. The old database will be
     /// overwritten.
@@ -363,7 +372,10 @@ impl Galaxy {
     /// - There is an error while doing a filesystem operation
     /// - There is an error while parsing the database
     pub fn save(self) -> Result<()> {
-        let path = Database::location()?;
+        let path = match &self.path {
+            Some(path) => path.clone(),
+            None => Database::location()?,
+        };
         let file = fs::File::create(path)?;
         let writer = io::BufWriter::new(file);
         self.save_to_writer(writer)
@@ -542,6 +554,8 @@ impl Galaxy {
 
 #[cfg(test)]
 mod test {
+    use std::collections::BTreeMap;
+
     use chrono::DateTime;
 
     use crate::core::{Status, StatusHistory};
@@ -700,7 +714,7 @@ mod test {
                         .into()
                 }],
                 tags: vec![],
-                fields: HashMap::new()
+                fields: BTreeMap::new()
             }
         );
         assert_eq!(
@@ -713,7 +727,7 @@ mod test {
                 status: Status::Done,
                 history: vec![],
                 tags: vec!["tag1".into(), "tag2".into()],
-                fields: HashMap::from([
+                fields: BTreeMap::from([
                     ("key1".into(), "value1".into()),
                     ("key2".into(), "value2".into())
                 ])
@@ -783,7 +797,7 @@ mod test {
                             .into(),
                     }],
                     tags: vec![],
-                    fields: HashMap::default(),
+                    fields: BTreeMap::default(),
                 },
                 Planet {
                     id: 2,
@@ -793,7 +807,7 @@ mod test {
                     status: Status::Done,
                     history: vec![],
                     tags: vec!["tag1".to_string(), "tag2".to_string()],
-                    fields: HashMap::from([
+                    fields: BTreeMap::from([
                         ("key1".to_string(), "value1".to_string()),
                         ("key2".to_string(), "value2".to_string()),
                     ]),
@@ -814,6 +828,7 @@ mod test {
                 (2, CelestialBodyIndex::new(CelestialBodyKind::Planet, 1)),
                 (3, CelestialBodyIndex::new(CelestialBodyKind::Star, 0)),
             ]),
+            path: None,
         };
 
         let mut writer = Vec::new();
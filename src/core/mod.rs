@@ -56,10 +56,10 @@ mod star;
 use std::fmt::Display;
 
 use chrono::{DateTime, Utc};
+use clap::ValueEnum;
 use colored::Colorize;
 use serde::{Deserialize, Serialize};
 
-use crate::app::cli;
 pub use crate::core::comet::Comet;
 pub use crate::core::galaxy::{CelestialBodyIndex, DatabaseError, Galaxy};
 pub use crate::core::planet::Planet;
@@ -105,7 +105,7 @@ pub trait CelestialBody<'a>:
 ////////////////////////////////////////////////////////////////////////////////
 
 /// Represents the different types of celestial bodies
-#[derive(Debug, Clone, Copy, PartialEq, Eq, PartialOrd, Ord, cli::ValueEnum)]
+#[derive(Debug, Clone, Copy, PartialEq, Eq, PartialOrd, Ord, ValueEnum)]
 pub enum CelestialBodyKind {
     /// An interrupting task / bug
     Comet,
@@ -35,12 +35,12 @@
 //                                                                            //
 ////////////////////////////////////////////////////////////////////////////////
 
-use std::collections::{BTreeMap, HashMap};
+use std::collections::BTreeMap;
 
 use chrono::Utc;
 use colored::Colorize;
 use log::info;
-use serde::{Deserialize, Serialize, Serializer};
+use serde::{Deserialize, Serialize};
 
 use crate::util;
 
@@ -70,18 +70,9 @@ pub struct Planet {
     pub(super) tags: Vec<String>,
     /// User defined fields. These can be used for searching, filtering,
     /// labeling, etc. They consist of a key and an associated value. They will
-    /// not affect the Planet otherwise.
-    #[serde(serialize_with = "ordered_map")]
-    pub(super) fields: HashMap<String, String>,
-}
-
-/// Helper function to ensure that HashMaps are serialized in order
-fn ordered_map<S>(value: &HashMap<String, String>, serializer: S) -> Result<S::Ok, S::Error>
-where
-    S: Serializer,
-{
-    let ordered: BTreeMap<_, _> = value.iter().collect();
-    ordered.serialize(serializer)
+    /// not affect the Planet otherwise. These are kept ordered so that they
+    /// are serialized in a stable order.
+    pub(super) fields: BTreeMap<String, String>,
 }
 
 impl CelestialBody<'_> for Planet {
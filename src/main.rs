@@ -33,12 +33,17 @@ use planit::{
 
 fn main() {
     util::panic::init_hook();
-    util::log::init();
 
+    // Parse before setting up logging so that `--help`, `--version`, and
+    // invalid arguments exit without touching the filesystem
     let args = Cli::parse();
+    util::log::init();
+
     let result = app::run(args);
 
     if let Err(e) = result {
         error!("Error in running application: {e}");
+        eprintln!("{e}");
+        std::process::exit(1);
     }
 }